@@ -34,6 +34,20 @@ class VMCommand(BaseModel):
     vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")]
     command: Annotated[str, Field(description="Shell command to run (e.g. 'uname -a', 'systemctl status nginx')")]
 
+class CreateVMParams(BaseModel):
+    """Model for VM creation parameters.
+
+    Validates VM creation inputs client-side so malformed names,
+    ISO volume IDs, or resource sizes fail fast instead of after
+    a wasted API round-trip.
+    """
+    node: Annotated[str, Field(description="Host node name (e.g. 'pve1')")]
+    name: Annotated[str, Field(pattern=r"^[A-Za-z0-9._-]{1,63}$", description="Name for the new VM")]
+    iso: Annotated[str, Field(pattern=r"^[^,]+:iso/[^,]+\.iso$", description="ISO volume ID (e.g. 'local:iso/ubuntu-22.04.iso')")]
+    cores: Annotated[int, Field(ge=1, le=256, description="Number of CPU cores")] = 2
+    memory: Annotated[int, Field(ge=16, description="Memory in MB")] = 2048
+    storage: Annotated[str, Field(pattern=r"^[A-Za-z0-9_-]+$", description="Storage pool to use")] = "local-lvm"
+
 class ProxmoxConfig(BaseModel):
     """Model for Proxmox connection configuration.
     
@@ -14,8 +14,18 @@ across the MCP server.
 import logging
 from typing import Dict, Any
 from proxmoxer import ProxmoxAPI
+from requests.adapters import HTTPAdapter, Retry
 from ..config.models import ProxmoxConfig, AuthConfig
 
+# Connection pool sizing for the underlying requests session. A pool
+# large enough for the concurrent asyncio.gather fan-out in the VM tools
+# keeps TLS handshakes amortized across all API calls.
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF = 0.2
+HTTP_RETRY_STATUSES = [502, 503, 504]
+
 class ProxmoxManager:
     """Manager class for Proxmox API operations.
     
@@ -89,7 +99,8 @@ class ProxmoxManager:
         try:
             self.logger.info(f"Connecting to Proxmox host: {self.config['host']}")
             api = ProxmoxAPI(**self.config)
-            
+            self._configure_session(api)
+
             # Test connection
             api.version.get()
             self.logger.info("Successfully connected to Proxmox API")
@@ -99,6 +110,39 @@ class ProxmoxManager:
             self.logger.error(f"Failed to connect to Proxmox: {e}")
             raise RuntimeError(f"Failed to connect to Proxmox: {e}")
 
+    def _configure_session(self, api: ProxmoxAPI) -> None:
+        """Mount a pooled HTTP adapter on proxmoxer's requests session.
+
+        Proxmoxer keeps a single requests session for the API, but the
+        default adapter only pools a handful of connections. Sizing the
+        pool for the concurrent fan-out used by the VM tools keeps TCP
+        and TLS handshakes amortized across calls, and the retry policy
+        absorbs transient gateway errors.
+
+        Args:
+            api: Freshly constructed ProxmoxAPI instance
+        """
+        # Proxmoxer keeps the requests session in the resource store
+        # (built by backend.get_session()), not on the backend itself
+        store = getattr(api, "_store", None)
+        session = store.get("session") if isinstance(store, dict) else None
+        if session is None:
+            self.logger.warning(
+                "Could not access API backend session; using default connection pooling"
+            )
+            return
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=HTTP_RETRY_TOTAL,
+                backoff_factor=HTTP_RETRY_BACKOFF,
+                status_forcelist=HTTP_RETRY_STATUSES
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
     def get_api(self) -> ProxmoxAPI:
         """Get the initialized Proxmox API instance.
         
@@ -1,7 +1,7 @@
 """
 Core formatting functions for Proxmox MCP output.
 """
-from typing import List, Union, Dict, Any
+from typing import List, Optional, Union, Dict, Any
 from .theme import ProxmoxTheme
 from .colors import ProxmoxColors
 
@@ -126,7 +126,7 @@ class ProxmoxFormatters:
         return f"{prefix}{key_str}: {value}"
     
     @staticmethod
-    def format_command_output(success: bool, command: str, output: str, error: str = None) -> str:
+    def format_command_output(success: bool, command: str, output: str, error: Optional[str] = None) -> str:
         """Format command execution output.
         
         Args:
@@ -38,6 +38,7 @@ from .tools.definitions import (
     GET_VMS_DESC,
     EXECUTE_VM_COMMAND_DESC,
     CHANGE_VM_STATE_DESC,
+    CHANGE_VM_STATES_DESC,
     CREATE_VM_DESC,
     GET_CONTAINERS_DESC,
     GET_STORAGE_DESC,
@@ -96,8 +97,8 @@ class ProxmoxMCPServer:
 
         # VM tools
         @self.mcp.tool(description=GET_VMS_DESC)
-        def get_vms():
-            return self.vm_tools.get_vms()
+        async def get_vms():
+            return await self.vm_tools.get_vms()
 
         @self.mcp.tool(description=EXECUTE_VM_COMMAND_DESC)
         async def execute_vm_command(
@@ -108,15 +109,22 @@ class ProxmoxMCPServer:
             return await self.vm_tools.execute_command(node, vmid, command)
 
         @self.mcp.tool(description=CHANGE_VM_STATE_DESC)
-        def change_vm_state(
+        async def change_vm_state(
             node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
             vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")],
             action: Annotated[str, Field(description="Action to perform (e.g. 'start', 'stop', 'shutdown', 'reboot', 'reset', 'suspend', 'resume', 'pause', 'hibernate')")]
         ):
-            return self.vm_tools.change_vm_state(node, vmid, action)
+            return await self.vm_tools.change_vm_state(node, vmid, action)
+
+        @self.mcp.tool(description=CHANGE_VM_STATES_DESC)
+        async def change_vm_states(
+            targets: Annotated[List[dict], Field(description="List of VMs to act on, each {'node': ..., 'vmid': ...}")],
+            action: Annotated[str, Field(description="Action to perform on every VM (e.g. 'start', 'stop', 'shutdown', 'reboot', 'reset', 'suspend', 'resume', 'pause', 'hibernate')")]
+        ):
+            return await self.vm_tools.change_vm_states(targets, action)
 
         @self.mcp.tool(description=CREATE_VM_DESC)
-        def create_vm(
+        async def create_vm(
             node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
             name: Annotated[str, Field(description="Name for the new VM (e.g. 'my-new-vm')")],
             iso: Annotated[str, Field(description="ISO image filename from local storage (e.g. 'local:iso/ubuntu-22.04.iso')")],
@@ -124,7 +132,7 @@ class ProxmoxMCPServer:
             memory: Annotated[int, Field(description="Memory in MB (default: 2048)")] = 2048,
             storage: Annotated[str, Field(description="Storage pool to use (default: 'local-lvm')")] = "local-lvm"
         ):
-            return self.vm_tools.create_vm(node, name, iso, cores, memory, storage)
+            return await self.vm_tools.create_vm(node, name, iso, cores, memory, storage)
 
         # Storage tools
         @self.mcp.tool(description=GET_STORAGE_DESC)
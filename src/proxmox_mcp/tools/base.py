@@ -11,11 +11,31 @@ All tool implementations inherit from the ProxmoxTool base class to ensure
 consistent behavior and error handling across the MCP server.
 """
 import logging
-from typing import Any, Dict, List, Optional, Union
+import threading
+from typing import Any, Dict, List, NoReturn, Optional, Union
+from cachetools import LRUCache, TTLCache
 from mcp.types import TextContent as Content
 from proxmoxer import ProxmoxAPI
 from ..formatting import ProxmoxTemplates
 
+try:
+    # orjson serializes straight to bytes in C, several times faster
+    # than stdlib json on the list-of-dicts payloads the tools emit
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson wheels
+    orjson = None
+
+# VM configs (cores, ostype, scsihw) change rarely, so a short TTL is
+# enough to absorb repeated dashboard-style queries without going stale
+VM_CONFIG_CACHE_SIZE = 4096
+VM_CONFIG_CACHE_TTL = 30
+RESOURCE_CACHE_SIZE = 16
+RESOURCE_CACHE_TTL = 30
+QEMU_RESOURCE_CACHE_SIZE = 1024
+# Cluster membership changes on the order of hours, so even a short TTL
+# removes one round-trip from every listing call without staleness risk
+NODE_CACHE_TTL = 10
+
 class ProxmoxTool:
     """Base class for Proxmox MCP tools.
     
@@ -29,6 +49,19 @@ class ProxmoxTool:
     behavior and error handling across the MCP server.
     """
 
+    # Slots instead of a per-instance __dict__: tool objects are created
+    # per session, and slot descriptors also make attribute access a
+    # C-level offset lookup on the hot paths
+    __slots__ = (
+        "proxmox",
+        "logger",
+        "_vm_config_cache",
+        "_resource_cache",
+        "_qemu_resource_cache",
+        "_node_cache",
+        "_cache_lock",
+    )
+
     def __init__(self, proxmox_api: ProxmoxAPI):
         """Initialize the tool.
 
@@ -37,6 +70,131 @@ class ProxmoxTool:
         """
         self.proxmox = proxmox_api
         self.logger = logging.getLogger(f"proxmox-mcp.{self.__class__.__name__.lower()}")
+        self._vm_config_cache: TTLCache = TTLCache(
+            maxsize=VM_CONFIG_CACHE_SIZE, ttl=VM_CONFIG_CACHE_TTL
+        )
+        self._resource_cache: TTLCache = TTLCache(
+            maxsize=RESOURCE_CACHE_SIZE, ttl=RESOURCE_CACHE_TTL
+        )
+        self._qemu_resource_cache: LRUCache = LRUCache(
+            maxsize=QEMU_RESOURCE_CACHE_SIZE
+        )
+        self._node_cache: TTLCache = TTLCache(maxsize=1, ttl=NODE_CACHE_TTL)
+        # cachetools caches are not thread-safe and the VM tools hit them
+        # from asyncio.to_thread workers, so every probe/store goes
+        # through this lock; API fetches happen outside it
+        self._cache_lock = threading.Lock()
+
+    def _list_nodes(self) -> List[Dict[str, Any]]:
+        """List cluster nodes, served from the short-TTL topology cache.
+
+        Returns:
+            List of node dicts from /nodes
+        """
+        with self._cache_lock:
+            cached = self._node_cache.get("nodes")
+        if cached is not None:
+            return cached
+        nodes: List[Dict[str, Any]] = self.proxmox.nodes.get()
+        with self._cache_lock:
+            self._node_cache["nodes"] = nodes
+        return nodes
+
+    def refresh_topology(self) -> None:
+        """Drop the cached node list so the next lookup re-queries the cluster."""
+        with self._cache_lock:
+            self._node_cache.clear()
+
+    def _qemu(self, node: str, vmid: Any):
+        """Get the proxmoxer qemu resource wrapper for a VM.
+
+        Building nodes(node).qemu(vmid) walks proxmoxer's dynamic
+        attribute chain and allocates a fresh wrapper per segment on
+        every call; repeated operations on the same VM reuse the cached
+        leaf instead. The wrappers are stateless URL builders, so
+        caching them is safe.
+
+        Args:
+            node: Host node name
+            vmid: VM ID number
+
+        Returns:
+            Cached proxmoxer resource for /nodes/{node}/qemu/{vmid}
+        """
+        key = (node, vmid)
+        with self._cache_lock:
+            resource = self._qemu_resource_cache.get(key)
+        if resource is None:
+            resource = self.proxmox.nodes(node).qemu(vmid)
+            with self._cache_lock:
+                self._qemu_resource_cache[key] = resource
+        return resource
+
+    def _status(self, node: str, vmid: Any):
+        """Get the status sub-resource for a VM via the cached qemu wrapper.
+
+        Args:
+            node: Host node name
+            vmid: VM ID number
+
+        Returns:
+            Proxmoxer resource for /nodes/{node}/qemu/{vmid}/status
+        """
+        return self._qemu(node, vmid).status
+
+    def _get_vm_config(self, node: str, vmid: Any) -> Dict[str, Any]:
+        """Get a VM's config dict, served from the TTL cache when fresh.
+
+        Args:
+            node: Host node name
+            vmid: VM ID number
+
+        Returns:
+            Deserialized config dict from the Proxmox API
+        """
+        key = (node, vmid)
+        with self._cache_lock:
+            cached = self._vm_config_cache.get(key)
+        if cached is not None:
+            return cached
+        config: Dict[str, Any] = self._qemu(node, vmid).config.get()
+        with self._cache_lock:
+            self._vm_config_cache[key] = config
+        return config
+
+    def _get_cluster_resources(self, resource_type: str) -> List[Dict[str, Any]]:
+        """Get /cluster/resources entries, served from the TTL cache when fresh.
+
+        Args:
+            resource_type: Resource type filter (e.g. 'vm', 'storage')
+
+        Returns:
+            List of resource dicts from the Proxmox API
+        """
+        with self._cache_lock:
+            cached = self._resource_cache.get(resource_type)
+        if cached is not None:
+            return cached
+        resources: List[Dict[str, Any]] = self.proxmox.cluster.resources.get(
+            type=resource_type
+        )
+        with self._cache_lock:
+            self._resource_cache[resource_type] = resources
+        return resources
+
+    def invalidate_vm(self, node: str, vmid: Any) -> None:
+        """Drop cached metadata for a VM after a state-changing operation.
+
+        Called by tools that start/stop/create VMs so the next read
+        reflects the new state instead of a stale cache entry.
+
+        Args:
+            node: Host node name
+            vmid: VM ID number
+        """
+        with self._cache_lock:
+            self._vm_config_cache.pop((node, vmid), None)
+            self._resource_cache.pop("vm", None)
 
     def _format_response(self, data: Any, resource_type: Optional[str] = None) -> List[Content]:
         """Format response data into MCP content using templates.
@@ -70,6 +228,11 @@ class ProxmoxTool:
             formatted = ProxmoxTemplates.container_list(data)
         elif resource_type == "cluster":
             formatted = ProxmoxTemplates.cluster_status(data)
+        elif orjson is not None:
+            # Fallback to JSON formatting for unknown types
+            formatted = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
         else:
             # Fallback to JSON formatting for unknown types
             import json
@@ -77,7 +240,31 @@ class ProxmoxTool:
 
         return [Content(type="text", text=formatted)]
 
-    def _handle_error(self, operation: str, error: Exception) -> None:
+    def _make_error(self, operation: str, error: Exception) -> Dict[str, Any]:
+        """Build a cheap structured error entry for batch operations.
+
+        Unlike _handle_error, this neither raises nor formats a stack
+        trace: bulk paths (batched state changes, parallel listings)
+        collect these dicts so each failing VM costs one small
+        allocation and the rest of the batch keeps going. The full
+        traceback is only rendered when debug logging is enabled.
+
+        Args:
+            operation: Description of the operation that failed
+            error: The exception that occurred during the operation
+
+        Returns:
+            Dict with success flag, operation, error type, and message
+        """
+        self.logger.debug(f"Failed to {operation}", exc_info=error)
+        return {
+            "success": False,
+            "op": operation,
+            "error_type": type(error).__name__,
+            "error": str(error)
+        }
+
+    def _handle_error(self, operation: str, error: Exception) -> NoReturn:
         """Handle and log errors from Proxmox operations.
 
         Provides standardized error handling across all tools by:
@@ -96,6 +283,9 @@ class ProxmoxTool:
         error_msg = str(error)
         self.logger.error(f"Failed to {operation}: {error_msg}")
 
+        if "no such node" in error_msg.lower():
+            # The cached topology is likely stale; re-query on next use
+            self.refresh_topology()
         if "not found" in error_msg.lower():
             raise ValueError(f"Resource not found: {error_msg}")
         if "permission denied" in error_msg.lower():
@@ -28,6 +28,8 @@ class ClusterTools(ProxmoxTool):
     proper operation of the Proxmox environment.
     """
 
+    __slots__ = ()
+
     def get_cluster_status(self) -> List[Content]:
         """Get overall Proxmox cluster health and configuration status.
 
@@ -1,28 +1,41 @@
 """
 Tool descriptions for Proxmox MCP tools.
 """
+import sys
+
+_INTERN_MAX_LEN = 4096
+
+def _d(text: str) -> str:
+    """Intern a tool description so every importer shares one string object.
+
+    Worker-per-request deployments re-import this module in each
+    worker; interning keeps a single copy of each description alive
+    instead of allocating one per import site. Very long bodies are
+    left alone since interning them buys nothing.
+    """
+    return sys.intern(text) if len(text) < _INTERN_MAX_LEN else text
 
 # Node tool descriptions
-GET_NODES_DESC = """List all nodes in the Proxmox cluster with their status, CPU, memory, and role information.
+GET_NODES_DESC = _d("""List all nodes in the Proxmox cluster with their status, CPU, memory, and role information.
 
 Example:
-{"node": "pve1", "status": "online", "cpu_usage": 0.15, "memory": {"used": "8GB", "total": "32GB"}}"""
+{"node": "pve1", "status": "online", "cpu_usage": 0.15, "memory": {"used": "8GB", "total": "32GB"}}""")
 
-GET_NODE_STATUS_DESC = """Get detailed status information for a specific Proxmox node.
+GET_NODE_STATUS_DESC = _d("""Get detailed status information for a specific Proxmox node.
 
 Parameters:
 node* - Name/ID of node to query (e.g. 'pve1')
 
 Example:
-{"cpu": {"usage": 0.15}, "memory": {"used": "8GB", "total": "32GB"}}"""
+{"cpu": {"usage": 0.15}, "memory": {"used": "8GB", "total": "32GB"}}""")
 
 # VM tool descriptions
-GET_VMS_DESC = """List all virtual machines across the cluster with their status and resource usage.
+GET_VMS_DESC = _d("""List all virtual machines across the cluster with their status and resource usage.
 
 Example:
-{"vmid": "100", "name": "ubuntu", "status": "running", "cpu": 2, "memory": 4096}"""
+{"vmid": "100", "name": "ubuntu", "status": "running", "cpu": 2, "memory": 4096}""")
 
-CHANGE_VM_STATE_DESC = """Change the state of a virtual machine (shutdown, start, reboot, pause, hibernate, reset, etc.).
+CHANGE_VM_STATE_DESC = _d("""Change the state of a virtual machine (shutdown, start, reboot, pause, hibernate, reset, etc.).
 
 Parameters:
 node* - Host node name (e.g. 'pve1')
@@ -31,9 +44,19 @@ action* - Action to perform (one of: 'start', 'stop', 'shutdown', 'reboot', 'res
 
 Example:
 {"success": true, "action": "shutdown", "vmid": "100", "node": "pve1"}
-"""
+""")
+
+CHANGE_VM_STATES_DESC = _d("""Change the state of multiple virtual machines in one batch (e.g. shut down all VMs for a maintenance window).
 
-CREATE_VM_DESC = """Create (spin up) a new virtual machine from a local ISO.
+Parameters:
+targets* - List of VMs to act on, each {"node": ..., "vmid": ...} (e.g. [{"node": "pve1", "vmid": "100"}, {"node": "pve2", "vmid": "101"}])
+action* - Action to perform on every VM (one of: 'start', 'stop', 'shutdown', 'reboot', 'reset', 'suspend', 'resume', 'pause', 'hibernate')
+
+Example:
+[{"success": true, "action": "shutdown", "vmid": "100", "node": "pve1"}, {"success": false, "action": "shutdown", "vmid": "101", "node": "pve2", "error": "..."}]
+""")
+
+CREATE_VM_DESC = _d("""Create (spin up) a new virtual machine from a local ISO.
 
 Parameters:
 node* - Host node name (e.g. 'pve1')
@@ -45,9 +68,9 @@ storage - Storage pool to use (default: 'local-lvm')
 
 Example:
 {"success": true, "vmid": "101", "name": "my-new-vm", "node": "pve1"}
-"""
+""")
 
-EXECUTE_VM_COMMAND_DESC = """Execute commands in a VM via QEMU guest agent.
+EXECUTE_VM_COMMAND_DESC = _d("""Execute commands in a VM via QEMU guest agent.
 
 Parameters:
 node* - Host node name (e.g. 'pve1')
@@ -55,22 +78,22 @@ vmid* - VM ID number (e.g. '100')
 command* - Shell command to run (e.g. 'uname -a')
 
 Example:
-{"success": true, "output": "Linux vm1 5.4.0", "exit_code": 0}"""
+{"success": true, "output": "Linux vm1 5.4.0", "exit_code": 0}""")
 
 # Container tool descriptions
-GET_CONTAINERS_DESC = """List all LXC containers across the cluster with their status and configuration.
+GET_CONTAINERS_DESC = _d("""List all LXC containers across the cluster with their status and configuration.
 
 Example:
-{"vmid": "200", "name": "nginx", "status": "running", "template": "ubuntu-20.04"}"""
+{"vmid": "200", "name": "nginx", "status": "running", "template": "ubuntu-20.04"}""")
 
 # Storage tool descriptions
-GET_STORAGE_DESC = """List storage pools across the cluster with their usage and configuration.
+GET_STORAGE_DESC = _d("""List storage pools across the cluster with their usage and configuration.
 
 Example:
-{"storage": "local-lvm", "type": "lvm", "used": "500GB", "total": "1TB"}"""
+{"storage": "local-lvm", "type": "lvm", "used": "500GB", "total": "1TB"}""")
 
 # Cluster tool descriptions
-GET_CLUSTER_STATUS_DESC = """Get overall Proxmox cluster health and configuration status.
+GET_CLUSTER_STATUS_DESC = _d("""Get overall Proxmox cluster health and configuration status.
 
 Example:
-{"name": "proxmox", "quorum": "ok", "nodes": 3, "ha_status": "active"}"""
+{"name": "proxmox", "quorum": "ok", "nodes": 3, "ha_status": "active"}""")
@@ -30,6 +30,8 @@ class NodeTools(ProxmoxTool):
     node information might be temporarily unavailable.
     """
 
+    __slots__ = ()
+
     def get_nodes(self) -> List[Content]:
         """List all nodes in the Proxmox cluster with detailed status.
 
@@ -59,7 +61,7 @@ class NodeTools(ProxmoxTool):
             RuntimeError: If the cluster-wide node query fails
         """
         try:
-            result = self.proxmox.nodes.get()
+            result = self._list_nodes()
             nodes = []
             
             # Get detailed info for each node
@@ -30,6 +30,8 @@ class StorageTools(ProxmoxTool):
     storage information might be temporarily unavailable.
     """
 
+    __slots__ = ()
+
     def get_storage(self) -> List[Content]:
         """List storage pools across the cluster with detailed status.
 
@@ -13,12 +13,74 @@ This module provides tools for managing and interacting with Proxmox VMs:
 The tools implement fallback mechanisms for scenarios where
 detailed VM information might be temporarily unavailable.
 """
-from typing import List
+import asyncio
+import operator
+from typing import Any, AsyncIterator, Dict, List, Tuple, Union
 from mcp.types import TextContent as Content
+from proxmoxer import ProxmoxAPI
+from pydantic import ValidationError
+from ..config.models import CreateVMParams
 from .base import ProxmoxTool
 from .definitions import GET_VMS_DESC, EXECUTE_VM_COMMAND_DESC
 from .console.manager import VMConsoleManager
 
+# Actions accepted by the Proxmox status API; a frozenset gives O(1)
+# membership checks without rebuilding a list on every call
+_VALID_VM_ACTIONS: frozenset = frozenset({
+    "start", "stop", "shutdown", "reboot", "reset", "suspend", "resume", "pause", "hibernate"
+})
+
+# Precomputed action -> attrgetter table so the hot dispatch path avoids
+# a Python-level getattr per call; attrgetter is implemented in C
+_ACTION_DISPATCH = {action: operator.attrgetter(action) for action in _VALID_VM_ACTIONS}
+
+# Backoff schedule for polling Proxmox task status: start fast so short
+# tasks return quickly, then back off so long installs don't hammer the API
+_TASK_POLL_INITIAL_DELAY = 0.5
+_TASK_POLL_BACKOFF = 1.5
+_TASK_POLL_MAX_DELAY = 5.0
+
+def _mem(resource: Dict[str, Any]) -> Tuple[int, int]:
+    """Return (used, total) memory for a VM entry with one membership probe.
+
+    Proxmox reports mem and maxmem together, so a single "mem" check
+    replaces two dict.get calls with fallback branches; the common
+    path is then two direct subscripts.
+
+    Args:
+        resource: VM entry from /cluster/resources or a node qemu listing
+
+    Returns:
+        (used_bytes, total_bytes), or (0, 0) when memory data is absent
+    """
+    return (resource["mem"], resource["maxmem"]) if "mem" in resource else (0, 0)
+
+def _vm_row(resource: Dict[str, Any], cpus: Union[int, str]) -> Dict[str, Any]:
+    """Build one VM entry for the formatted listing.
+
+    Shared by the aggregate and fallback paths in get_vms so the row
+    shape is defined (and allocated) in exactly one place.
+
+    Args:
+        resource: One /cluster/resources entry for a VM
+        cpus: CPU core count, or 'N/A' when unknown
+
+    Returns:
+        Dict in the shape expected by the 'vms' response template
+    """
+    used, total = _mem(resource)
+    return {
+        "vmid": resource["vmid"],
+        "name": resource.get("name", "N/A"),
+        "status": resource["status"],
+        "node": resource["node"],
+        "cpus": cpus,
+        "memory": {
+            "used": used,
+            "total": total
+        }
+    }
+
 class VMTools(ProxmoxTool):
     """Tools for managing Proxmox VMs.
     
@@ -33,7 +95,9 @@ class VMTools(ProxmoxTool):
     with QEMU guest agent for VM command execution.
     """
 
-    def __init__(self, proxmox_api):
+    __slots__ = ("console_manager",)
+
+    def __init__(self, proxmox_api: ProxmoxAPI) -> None:
         """Initialize VM tools.
 
         Args:
@@ -42,7 +106,93 @@ class VMTools(ProxmoxTool):
         super().__init__(proxmox_api)
         self.console_manager = VMConsoleManager(proxmox_api)
 
-    def get_vms(self) -> List[Content]:
+    async def _list_vm_resources(self) -> List[Dict[str, Any]]:
+        """Get per-VM resource entries covering the whole cluster.
+
+        Prefers the single /cluster/resources aggregate call. If that
+        endpoint fails, falls back to querying every node's qemu
+        listing concurrently via asyncio.gather, so the fallback still
+        costs one round-trip of wall-clock time instead of one per
+        node. Nodes that error are skipped with a warning rather than
+        failing the whole query.
+
+        Returns:
+            List of resource dicts in /cluster/resources shape
+        """
+        try:
+            return await asyncio.to_thread(self._get_cluster_resources, "vm")
+        except Exception as e:
+            self.logger.warning(
+                f"cluster/resources query failed ({e}); falling back to per-node listing"
+            )
+        # Bind the proxmoxer accessor chain once instead of re-resolving
+        # self.proxmox.nodes per node in the fan-out below
+        nodes_factory = self.proxmox.nodes
+        nodes = await asyncio.to_thread(self._list_nodes)
+        vm_lists = await asyncio.gather(
+            *[asyncio.to_thread(nodes_factory(node["node"]).qemu.get)
+              for node in nodes],
+            return_exceptions=True
+        )
+        resources = []
+        for node, vms in zip(nodes, vm_lists):
+            if isinstance(vms, BaseException):
+                self.logger.warning(f"Skipping node {node['node']}: {vms}")
+                continue
+            for vm in vms:
+                used, total = _mem(vm)
+                entry = {
+                    "vmid": vm["vmid"],
+                    "name": vm.get("name", "N/A"),
+                    "status": vm["status"],
+                    "node": node["node"],
+                    "mem": used,
+                    "maxmem": total
+                }
+                if "cpus" in vm:
+                    entry["maxcpu"] = vm["cpus"]
+                resources.append(entry)
+        return resources
+
+    async def _iter_vm_rows(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield VM listing rows one at a time as their data resolves.
+
+        Rows whose CPU count is already present in the aggregate
+        /cluster/resources response are yielded immediately; the rare
+        entries needing a per-VM config fallback are yielded as each
+        lookup completes via asyncio.as_completed. Streaming rows keeps
+        peak memory at one row instead of the full intermediate list
+        for consumers that don't need it materialized.
+
+        Yields:
+            One dict per VM in the shape produced by _vm_row
+        """
+        resources = await self._list_vm_resources()
+        # Local bindings keep the per-row loop free of attribute lookups
+        make_row = _vm_row
+        get_vm_config = self._get_vm_config
+        pending = []
+        for resource in resources:
+            if "maxcpu" in resource:
+                yield make_row(resource, resource["maxcpu"])
+            else:
+                pending.append(resource)
+
+        async def _resolve(resource: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                config = await asyncio.to_thread(
+                    get_vm_config, resource["node"], resource["vmid"]
+                )
+                cpus = config.get("cores", "N/A")
+            except Exception:
+                # Fallback if can't get config
+                cpus = "N/A"
+            return make_row(resource, cpus)
+
+        for future in asyncio.as_completed([_resolve(resource) for resource in pending]):
+            yield await future
+
+    async def get_vms(self) -> List[Content]:
         """List all virtual machines across the cluster with detailed status.
 
         Retrieves comprehensive information for each VM including:
@@ -52,7 +202,13 @@ class VMTools(ProxmoxTool):
           * CPU cores
           * Memory allocation and usage
         - Node placement
-        
+
+        Uses the /cluster/resources aggregate endpoint so the whole
+        cluster is covered by a single API call instead of one request
+        per node plus one per VM. The rare entries that lack CPU data
+        fall back to a per-VM config lookup, issued concurrently via
+        asyncio.gather.
+
         Implements a fallback mechanism that returns basic information
         if detailed configuration retrieval fails for any VM.
 
@@ -74,39 +230,7 @@ class VMTools(ProxmoxTool):
             RuntimeError: If the cluster-wide VM query fails
         """
         try:
-            result = []
-            for node in self.proxmox.nodes.get():
-                node_name = node["node"]
-                vms = self.proxmox.nodes(node_name).qemu.get()
-                for vm in vms:
-                    vmid = vm["vmid"]
-                    # Get VM config for CPU cores
-                    try:
-                        config = self.proxmox.nodes(node_name).qemu(vmid).config.get()
-                        result.append({
-                            "vmid": vmid,
-                            "name": vm["name"],
-                            "status": vm["status"],
-                            "node": node_name,
-                            "cpus": config.get("cores", "N/A"),
-                            "memory": {
-                                "used": vm.get("mem", 0),
-                                "total": vm.get("maxmem", 0)
-                            }
-                        })
-                    except Exception:
-                        # Fallback if can't get config
-                        result.append({
-                            "vmid": vmid,
-                            "name": vm["name"],
-                            "status": vm["status"],
-                            "node": node_name,
-                            "cpus": "N/A",
-                            "memory": {
-                                "used": vm.get("mem", 0),
-                                "total": vm.get("maxmem", 0)
-                            }
-                        })
+            result = [row async for row in self._iter_vm_rows()]
             return self._format_response(result, "vms")
         except Exception as e:
             self._handle_error("get VMs", e)
@@ -151,9 +275,127 @@ class VMTools(ProxmoxTool):
         except Exception as e:
             self._handle_error(f"execute command on VM {vmid}", e)
 
-    def change_vm_state(self, node: str, vmid: str, action: str) -> List[Content]:
+    async def _apply_vm_action(self, targets: List[dict], action: str) -> List[dict]:
+        """Apply a state-change action to a batch of VMs concurrently.
+
+        Validates the action once, then issues one status POST per target
+        via asyncio.gather so the batch completes in roughly one round-trip.
+
+        Args:
+            targets: List of {"node": ..., "vmid": ...} dicts
+            action: Action to perform on every target
+
+        Returns:
+            One result dict per target: {"success", "action", "vmid", "node"}
+            plus an "error" message for targets that failed.
+
+        Raises:
+            ValueError: If the action is invalid
+        """
+        if action not in _VALID_VM_ACTIONS:
+            raise ValueError(f"Invalid action: {action}. Must be one of {sorted(_VALID_VM_ACTIONS)}")
+
+        # The Proxmox API uses .status.<action>.post() for most actions;
+        # the validated action is guaranteed to be in the dispatch table
+        get_action = _ACTION_DISPATCH[action]
+        status_of = self._status
+        coros = [
+            asyncio.to_thread(get_action(status_of(target["node"], target["vmid"])).post)
+            for target in targets
+        ]
+        outcomes = await asyncio.gather(*coros, return_exceptions=True)
+
+        results = []
+        for target, outcome in zip(targets, outcomes):
+            if isinstance(outcome, Exception):
+                result = self._make_error(f"change VM state ({action})", outcome)
+            else:
+                # Punch the stale cache entry so the next read sees the new state
+                self.invalidate_vm(target["node"], target["vmid"])
+                result = {"success": True}
+            result.update({
+                "action": action,
+                "vmid": target["vmid"],
+                "node": target["node"]
+            })
+            results.append(result)
+        return results
+
+    async def change_vm_states(self, targets: List[dict], action: str) -> List[Content]:
+        """Change the state of multiple VMs in one batch.
+
+        Useful for maintenance windows where dozens of VMs are started or
+        shut down together; the POSTs run concurrently instead of one
+        round-trip per VM. Individual failures are reported per VM rather
+        than aborting the batch.
+
+        Args:
+            targets: List of {"node": ..., "vmid": ...} dicts
+            action: Action to perform (e.g., 'start', 'stop', 'shutdown', 'reboot', 'reset', 'suspend', 'resume', 'pause', 'hibernate')
+
+        Returns:
+            List of Content objects with one success/failure entry per VM.
+
+        Raises:
+            ValueError: If the action is invalid
+            RuntimeError: If the batch cannot be dispatched
+        """
+        try:
+            results = await self._apply_vm_action(targets, action)
+            return self._format_response(results)
+        except Exception as e:
+            self._handle_error(f"change VM states ({action})", e)
+
+    def change_vm_state_async(self, node: str, vmid: str, action: str) -> "asyncio.Task":
+        """Enqueue a VM state change and return without waiting for it.
+
+        Fire-and-forget variant for callers that want to dispatch many
+        state changes (e.g. "reboot all") and confirm completion later:
+        the POST runs in a background task which can be awaited directly
+        or joined in bulk via wait_state_changes. Must be called from a
+        running event loop.
+
+        Args:
+            node: Host node name (e.g., 'pve1')
+            vmid: VM ID number (e.g., '100')
+            action: Action to perform (e.g., 'start', 'stop', 'shutdown', 'reboot', 'reset', 'suspend', 'resume', 'pause', 'hibernate')
+
+        Returns:
+            asyncio.Task resolving to the Proxmox API response.
+
+        Raises:
+            ValueError: If the action is invalid
+        """
+        if action not in _VALID_VM_ACTIONS:
+            raise ValueError(f"Invalid action: {action}. Must be one of {sorted(_VALID_VM_ACTIONS)}")
+        post = _ACTION_DISPATCH[action](self._status(node, vmid)).post
+        task = asyncio.create_task(asyncio.to_thread(post))
+
+        def _invalidate_on_success(done: "asyncio.Task") -> None:
+            if not done.cancelled() and done.exception() is None:
+                self.invalidate_vm(node, vmid)
+
+        task.add_done_callback(_invalidate_on_success)
+        return task
+
+    @staticmethod
+    async def wait_state_changes(tasks: List["asyncio.Task"]) -> List:
+        """Await a batch of state changes enqueued via change_vm_state_async.
+
+        Args:
+            tasks: Tasks returned by change_vm_state_async
+
+        Returns:
+            One entry per task: the API response, or the exception
+            instance for changes that failed.
+        """
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def change_vm_state(self, node: str, vmid: str, action: str) -> List[Content]:
         """Change the state of a VM (shutdown, start, reboot, pause, hibernate, reset, etc.).
 
+        Thin wrapper over the batch path with a single target.
+
         Args:
             node: Host node name (e.g., 'pve1')
             vmid: VM ID number (e.g., '100')
@@ -167,30 +409,37 @@ class VMTools(ProxmoxTool):
             RuntimeError: If the state change fails
         """
         try:
-            valid_actions = [
-                "start", "stop", "shutdown", "reboot", "reset", "suspend", "resume", "pause", "hibernate"
-            ]
-            if action not in valid_actions:
-                raise ValueError(f"Invalid action: {action}. Must be one of {valid_actions}")
-
-            # The Proxmox API uses .status.<action>.post() for most actions
-            status_api = self.proxmox.nodes(node).qemu(vmid).status
-            api_method = getattr(status_api, action, None)
-            if not api_method:
-                raise ValueError(f"Action '{action}' is not supported by the Proxmox API.")
-
-            api_method.post()
-            result = {
-                "success": True,
-                "action": action,
-                "vmid": vmid,
-                "node": node
-            }
+            result = (await self._apply_vm_action([{"node": node, "vmid": vmid}], action))[0]
+            if not result["success"]:
+                raise RuntimeError(result["error"])
             return self._format_response(result)
         except Exception as e:
             self._handle_error(f"change VM state ({action}) for VM {vmid}", e)
 
-    def create_vm(
+    async def _wait_for_task(self, node: str, upid: str) -> Dict[str, Any]:
+        """Poll a Proxmox task until it leaves the 'running' state.
+
+        Uses exponential backoff between polls so short tasks complete
+        in one or two round-trips while long-running ones don't hammer
+        the API.
+
+        Args:
+            node: Host node the task runs on
+            upid: Task identifier returned by the triggering POST
+
+        Returns:
+            Final task status dict, including 'exitstatus'
+        """
+        task_api = self.proxmox.nodes(node).tasks(upid).status
+        delay = _TASK_POLL_INITIAL_DELAY
+        while True:
+            status: Dict[str, Any] = await asyncio.to_thread(task_api.get)
+            if status.get("status") != "running":
+                return status
+            await asyncio.sleep(delay)
+            delay = min(delay * _TASK_POLL_BACKOFF, _TASK_POLL_MAX_DELAY)
+
+    async def create_vm(
         self,
         node: str,
         name: str,
@@ -201,6 +450,10 @@ class VMTools(ProxmoxTool):
     ) -> List[Content]:
         """Create (spin up) a new VM from a local ISO.
 
+        Waits for the creation task to finish by polling its UPID with
+        exponential backoff, so callers get a definitive success or
+        failure instead of having to poll externally.
+
         Args:
             node: Host node name (e.g., 'pve1')
             name: Name for the new VM
@@ -216,28 +469,46 @@ class VMTools(ProxmoxTool):
             ValueError: If required parameters are missing or invalid
             RuntimeError: If VM creation fails
         """
+        # Validate inputs before spending any API round-trips
+        try:
+            p = CreateVMParams(
+                node=node, name=name, iso=iso,
+                cores=cores, memory=memory, storage=storage
+            )
+        except ValidationError as e:
+            raise ValueError(f"Invalid VM parameters: {e}") from e
+
         try:
             # Find the next available VMID
-            vmid = self.proxmox.cluster.nextid.get()
+            vmid = await asyncio.to_thread(self.proxmox.cluster.nextid.get)
             vmid = int(vmid)
             params = {
                 "vmid": vmid,
-                "name": name,
-                "ide2": iso + ",media=cdrom",
+                "name": p.name,
+                "ide2": p.iso + ",media=cdrom",
                 "ostype": "l26",
-                "cores": cores,
-                "memory": memory,
+                "cores": p.cores,
+                "memory": p.memory,
                 "scsihw": "virtio-scsi-pci",
-                "scsi0": f"{storage}:32",  # 32GB default disk
+                "scsi0": f"{p.storage}:32",  # 32GB default disk
                 "boot": "order=ide2;scsi0"
             }
-            self.proxmox.nodes(node).qemu.post(**params)
+            qemu_api = self.proxmox.nodes(p.node).qemu
+            upid = await asyncio.to_thread(lambda: qemu_api.post(**params))
+            # The cached VM resource list no longer includes the new VM
+            with self._cache_lock:
+                self._resource_cache.pop("vm", None)
             result = {
                 "success": True,
                 "vmid": vmid,
-                "name": name,
-                "node": node
+                "name": p.name,
+                "node": p.node
             }
+            if isinstance(upid, str):
+                task_status = await self._wait_for_task(p.node, upid)
+                result["success"] = task_status.get("exitstatus") == "OK"
+                if not result["success"]:
+                    result["error"] = task_status.get("exitstatus", "unknown")
             return self._format_response(result)
         except Exception as e:
             self._handle_error("create VM", e)
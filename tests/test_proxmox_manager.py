@@ -0,0 +1,46 @@
+"""
+Tests for Proxmox API connection management.
+"""
+
+import requests
+from unittest.mock import Mock, patch
+
+from proxmox_mcp.config.models import AuthConfig, ProxmoxConfig
+from proxmox_mcp.core.proxmox import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_TOTAL,
+    ProxmoxManager,
+)
+
+def _make_manager(api):
+    """Build a ProxmoxManager against a stubbed ProxmoxAPI."""
+    with patch("proxmox_mcp.core.proxmox.ProxmoxAPI", return_value=api):
+        return ProxmoxManager(
+            ProxmoxConfig(host="test.proxmox.com"),
+            AuthConfig(user="test@pve", token_name="t", token_value="v"),
+        )
+
+def test_pooled_adapter_mounted_on_session():
+    """The sized HTTPAdapter must actually land on proxmoxer's session."""
+    session = requests.Session()
+    api = Mock()
+    api._store = {"session": session}
+
+    _make_manager(api)
+
+    adapter = session.get_adapter("https://test.proxmox.com:8006/api2/json")
+    assert adapter._pool_connections == HTTP_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == HTTP_RETRY_TOTAL
+    # http:// goes through the same pooled adapter
+    assert session.get_adapter("http://test.proxmox.com") is adapter
+
+def test_missing_session_falls_back_to_defaults():
+    """A backend without a reachable session must not break startup."""
+    api = Mock()
+    api._store = None
+
+    manager = _make_manager(api)
+
+    assert manager.get_api() is api
@@ -0,0 +1,143 @@
+"""
+Tests for VM management tools.
+"""
+
+import json
+import pytest
+from unittest.mock import Mock
+
+from proxmox_mcp.tools.vm import VMTools
+
+@pytest.fixture
+def mock_proxmox():
+    """Fixture to create a mock ProxmoxAPI instance."""
+    mock = Mock()
+    mock.cluster.resources.get.return_value = [
+        {"vmid": 100, "name": "vm1", "status": "running",
+         "node": "node1", "mem": 1024, "maxmem": 2048, "maxcpu": 2},
+        {"vmid": 101, "name": "vm2", "status": "stopped",
+         "node": "node2", "mem": 0, "maxmem": 4096, "maxcpu": 4},
+    ]
+    mock.cluster.nextid.get.return_value = "102"
+    mock.nodes.return_value.qemu.post.return_value = (
+        "UPID:node1:0000ABCD:00001234:65B0C1D2:qmcreate:102:root@pam:"
+    )
+    mock.nodes.return_value.tasks.return_value.status.get.return_value = {
+        "status": "stopped",
+        "exitstatus": "OK"
+    }
+    return mock
+
+@pytest.fixture
+def vm_tools(mock_proxmox):
+    """Fixture to create a VMTools instance."""
+    return VMTools(mock_proxmox)
+
+@pytest.mark.asyncio
+async def test_get_vms(vm_tools):
+    """Test listing VMs from the aggregate resources query."""
+    response = await vm_tools.get_vms()
+
+    text = response[0].text
+    assert "vm1" in text
+    assert "vm2" in text
+
+@pytest.mark.asyncio
+async def test_change_vm_state_success(vm_tools, mock_proxmox):
+    """Test successful single VM state change."""
+    response = await vm_tools.change_vm_state("node1", "100", "shutdown")
+    result = json.loads(response[0].text)
+
+    assert result["success"] is True
+    assert result["action"] == "shutdown"
+    assert result["vmid"] == "100"
+    mock_proxmox.nodes.return_value.qemu.return_value.status.shutdown.post \
+        .assert_called_once()
+
+@pytest.mark.asyncio
+async def test_change_vm_state_invalid_action(vm_tools):
+    """Test state change with an unknown action."""
+    with pytest.raises(ValueError, match="Invalid action"):
+        await vm_tools.change_vm_state("node1", "100", "explode")
+
+@pytest.mark.asyncio
+async def test_change_vm_states_batch_success(vm_tools):
+    """Test batch state change across multiple VMs."""
+    targets = [
+        {"node": "node1", "vmid": "100"},
+        {"node": "node2", "vmid": "101"},
+    ]
+
+    response = await vm_tools.change_vm_states(targets, "start")
+    results = json.loads(response[0].text)
+
+    assert len(results) == 2
+    assert all(entry["success"] for entry in results)
+    assert [entry["vmid"] for entry in results] == ["100", "101"]
+
+@pytest.mark.asyncio
+async def test_change_vm_states_reports_per_vm_failure(vm_tools, mock_proxmox):
+    """Test that one failing VM does not abort the batch."""
+    mock_proxmox.nodes.return_value.qemu.return_value.status.stop.post.side_effect = [
+        Exception("VM is locked"),
+        None,
+    ]
+    targets = [
+        {"node": "node1", "vmid": "100"},
+        {"node": "node1", "vmid": "101"},
+    ]
+
+    response = await vm_tools.change_vm_states(targets, "stop")
+    results = json.loads(response[0].text)
+
+    assert results[0]["success"] is False
+    assert "locked" in results[0]["error"]
+    assert results[0]["error_type"] == "Exception"
+    assert results[1]["success"] is True
+
+@pytest.mark.asyncio
+async def test_change_vm_states_invalid_action(vm_tools):
+    """Test batch state change with an unknown action."""
+    with pytest.raises(ValueError, match="Invalid action"):
+        await vm_tools.change_vm_states([{"node": "node1", "vmid": "100"}], "explode")
+
+@pytest.mark.asyncio
+async def test_create_vm_waits_for_task(vm_tools, mock_proxmox):
+    """Test VM creation reporting the creation task's exit status."""
+    response = await vm_tools.create_vm("node1", "new-vm", "local:iso/ubuntu-22.04.iso")
+    result = json.loads(response[0].text)
+
+    assert result["success"] is True
+    assert result["vmid"] == 102
+    assert result["name"] == "new-vm"
+    mock_proxmox.nodes.return_value.tasks.return_value.status.get.assert_called()
+
+@pytest.mark.asyncio
+async def test_create_vm_reports_task_failure(vm_tools, mock_proxmox):
+    """Test VM creation when the creation task fails server-side."""
+    mock_proxmox.nodes.return_value.tasks.return_value.status.get.return_value = {
+        "status": "stopped",
+        "exitstatus": "unable to create image"
+    }
+
+    response = await vm_tools.create_vm("node1", "new-vm", "local:iso/ubuntu-22.04.iso")
+    result = json.loads(response[0].text)
+
+    assert result["success"] is False
+    assert result["error"] == "unable to create image"
+
+@pytest.mark.asyncio
+async def test_create_vm_rejects_invalid_name(vm_tools, mock_proxmox):
+    """Test VM creation with an invalid name."""
+    with pytest.raises(ValueError, match="Invalid VM parameters"):
+        await vm_tools.create_vm("node1", "bad name!", "local:iso/ubuntu-22.04.iso")
+
+    mock_proxmox.nodes.return_value.qemu.post.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_create_vm_rejects_invalid_iso(vm_tools, mock_proxmox):
+    """Test VM creation with a malformed ISO volume ID."""
+    with pytest.raises(ValueError, match="Invalid VM parameters"):
+        await vm_tools.create_vm("node1", "new-vm", "not-an-iso")
+
+    mock_proxmox.nodes.return_value.qemu.post.assert_not_called()